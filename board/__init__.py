@@ -0,0 +1,4 @@
+"""
+Recognition Board pages and the data and photo layers they share.
+RecognitionBoard.py imports one page module per run, on demand.
+"""
@@ -0,0 +1,45 @@
+"""
+AL Selection Board page.
+"""
+import streamlit as st
+from board.data import load_board_frame, show_write_status
+from board.review import al_decision_form, review_board_rows, review_table
+
+AL_EXCLUDED_TITLES = ["Special Mentions", "Spot Award", "Impact Award"]
+
+def al_listed_rows(frame):
+    """Row mask of the nominations the AL table lists: with an ID, outside the excluded titles."""
+    return (
+        ~frame["Nominated Title"].isin(AL_EXCLUDED_TITLES) &
+        frame["Nomination ID"].notna() &
+        (frame["Nomination ID"].astype(str).str.strip() != "")
+    ).to_numpy()
+
+def render():
+    revision, merged_df = load_board_frame()
+    show_write_status()
+
+    # --- Sidebar Filters (a fragment; the page reruns only when the selected rows change) ---
+    merged_df = review_board_rows(merged_df, revision, "al", listed=al_listed_rows(merged_df))
+    
+    st.subheader("AL Selection Board")
+    
+    try:
+        # Display names were applied at ingest (normalize_nomination_frame)
+        df_display = merged_df[al_listed_rows(merged_df)]
+
+        # Show styled table
+        review_table(
+            df_display,
+            ["Nomination ID", "Employee ID", "Employee Name", "Manager Name", "Designation", "Account Name", "Rank", "Nominated Title", "Self Nomination Reason", "AL Approval Status", "AL Comment"],
+            ["AL Approval Status"],
+            key="al_table",
+            height=250
+        )
+    
+        st.markdown("---")
+    
+        al_decision_form(merged_df)
+
+    except Exception as e:
+        st.error(f"Error loading Excel: {e}")
@@ -0,0 +1,38 @@
+"""
+BU Head Selection Board page.
+"""
+import streamlit as st
+from board.data import load_board_frame, show_write_status
+from board.review import bu_decision_form, review_board_rows, review_table
+
+def render():
+    revision, merged_df = load_board_frame()
+    show_write_status()
+
+    # --- Sidebar Filters (a fragment; the page reruns only when the selected rows change) ---
+    merged_df = review_board_rows(merged_df, revision, "bu")
+    
+    st.subheader("BU Head Selection Board")
+
+    try:
+        # Display names were applied at ingest (normalize_nomination_frame)
+        df_display = merged_df
+
+        # Filter to show only nominations approved by AL
+        df_display_filtered = df_display[df_display["AL Approval Status"] == "Approved"]
+
+        # Show styled table
+        review_table(
+            df_display_filtered,
+            ["Nomination ID", "Employee ID", "Employee Name","Manager Name", "Designation", "Account Name", "Rank", "Nominated Title", "Self Nomination Reason", "AL Approval Status", "AL Comment", "BU Head Approval Status", "BU Head Comment","BU Head Rank"],
+            ["AL Approval Status", "BU Head Approval Status"],
+            key="bu_table"
+        )
+
+        st.markdown("---")
+
+        bu_decision_form(merged_df)
+
+    except Exception as e:
+        st.error(f"Error loading Excel: {e}")
+    
@@ -0,0 +1,789 @@
+"""
+Google Sheets access for the review pages: loading, the shared per-revision
+merged frame and its filter/search indexes, and the background decision writer.
+"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import gspread
+from pandas.io.parsers import TextParser
+from google.oauth2.service_account import Credentials
+import os
+import time
+import random
+import queue
+import threading
+import uuid
+import hashlib
+import collections
+import difflib
+import requests
+
+# Sessions share one merged frame per sheet revision (get_merged_frame); with
+# Copy-on-Write, filtered and overlaid frames never write through to it. pandas 3
+# always copies on write and warns when the option is set, so only opt in before 3
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# # Your Google Sheet ID and worksheet name
+SHEET_ID = "18GgoG_BtBO10tbmNDCi2RN0MVnAjfClYhilEUnxBdIc"
+EMPLOYEE_SHEET_NAME = "Employee Data"
+NOMINATION_NAME = "Nomination Data"
+
+# --- Google Sheets setup ---
+# --- Connect to Google Sheets using Streamlit secrets ---
+# Client, spreadsheet and worksheet handles live once per server process and are shared by all sessions
+@st.cache_resource(show_spinner=False)
+def get_gspread_client():
+    service_account_info = st.secrets["google_service_account"]
+    scopes = ["https://www.googleapis.com/auth/spreadsheets", "https://www.googleapis.com/auth/drive"]
+    credentials = Credentials.from_service_account_info(service_account_info, scopes=scopes)
+    return gspread.authorize(credentials)
+
+@st.cache_resource(show_spinner=False)
+def get_spreadsheet():
+    return get_gspread_client().open_by_key(SHEET_ID)
+
+@st.cache_resource(show_spinner=False)
+def get_worksheet(name):
+    return get_spreadsheet().worksheet(name)
+
+def values_to_dataframe(values):
+    """
+    Parse raw sheet values (header row first) the way get_as_dataframe does:
+    type inference via TextParser, empty rows and unnamed empty columns dropped.
+    """
+    if not values:
+        return pd.DataFrame()
+    width = max(len(row) for row in values)
+    rows = [row + [""] * (width - len(row)) for row in values]
+    frame = TextParser(rows, header=0).read()
+    empty_unnamed = [
+        c for c in frame.columns
+        if str(c).startswith("Unnamed:") and frame[c].isna().all()
+    ]
+    return frame.drop(columns=empty_unnamed).dropna(how="all")
+
+# --- Columns to bring from df1 ---
+columns_from_df1 = ["Employee Id", "Employee Name", "Manager Name", "Designation", "Account Name", "Rank"]
+
+# Read only columns_from_df1 from Employee Data instead of every column of the HR export
+EMPLOYEE_COLUMN_PROJECTION = True
+
+# How long (seconds) a sheet revision is trusted before asking Drive whether it changed
+SHEETS_CACHE_TTL = int(os.environ.get("RB_SHEETS_CACHE_TTL", "60"))
+
+@st.cache_data(ttl=SHEETS_CACHE_TTL, show_spinner=False)
+def get_sheet_revision():
+    """
+    Return the spreadsheet's Drive modifiedTime. Cached for SHEETS_CACHE_TTL seconds,
+    so at most one metadata call per TTL window is made across all reruns.
+    """
+    return get_spreadsheet().get_lastUpdateTime()
+
+@st.cache_data(show_spinner=False)
+def get_employee_header():
+    """
+    Resolve the Employee Data header row once. Cleared together with the sheet
+    cache, or when a projected read finds the columns have moved.
+    """
+    response = get_spreadsheet().values_batch_get([f"'{EMPLOYEE_SHEET_NAME}'!1:1"])
+    values = response["valueRanges"][0].get("values", [])
+    return values[0] if values else []
+
+def column_letter(position):
+    """1-based column position -> A1 column letter(s)."""
+    return gspread.utils.rowcol_to_a1(1, position)[:-1]
+
+def contiguous_column_runs(header, columns):
+    """
+    Group the wanted columns into contiguous 1-based (first, last) position runs,
+    so e.g. columns at B, C, D and G are read as two ranges B:D and G:G.
+    """
+    positions = sorted(header.index(c) + 1 for c in columns)
+    runs = []
+    for pos in positions:
+        if runs and pos == runs[-1][1] + 1:
+            runs[-1][1] = pos
+        else:
+            runs.append([pos, pos])
+    return runs
+
+def stitch_column_ranges(value_ranges, widths):
+    """
+    Join side-by-side column ranges back into one row-major values list.
+    The API trims trailing empty cells and rows, so each block is padded first.
+    """
+    height = max((len(vr.get("values", [])) for vr in value_ranges), default=0)
+    rows = [[] for _ in range(height)]
+    for vr, width in zip(value_ranges, widths):
+        block = vr.get("values", [])
+        for i in range(height):
+            cells = block[i] if i < len(block) else []
+            rows[i].extend(cells + [""] * (width - len(cells)))
+    return rows
+
+@st.cache_data(max_entries=2, show_spinner="Loading nominations...")
+def load_sheet_data(revision):
+    """
+    Download Nomination Data and Employee Data in a single batched values request.
+    Keyed on the sheet revision, so the sheets are only re-downloaded when the
+    spreadsheet actually changed.
+    """
+    runs = []
+    if EMPLOYEE_COLUMN_PROJECTION:
+        header = get_employee_header()
+        if all(c in header for c in columns_from_df1):
+            runs = contiguous_column_runs(header, columns_from_df1)
+
+    if runs:
+        employee_ranges = [f"'{EMPLOYEE_SHEET_NAME}'!{column_letter(a)}:{column_letter(b)}" for a, b in runs]
+    else:
+        employee_ranges = [f"'{EMPLOYEE_SHEET_NAME}'"]
+
+    # Stamped before the download: a write landing mid-download may be missing from the data
+    started_at = time.time()
+
+    # FORMATTED_VALUE (the API default) returns evaluated formulas
+    response = get_spreadsheet().values_batch_get([f"'{NOMINATION_NAME}'"] + employee_ranges)
+    value_ranges = response["valueRanges"]
+    nomination_values = value_ranges[0].get("values", [])
+
+    if not runs:
+        employee_values = value_ranges[1].get("values", [])
+    else:
+        employee_values = stitch_column_ranges(value_ranges[1:], [b - a + 1 for a, b in runs])
+
+        # Columns moved since the header was resolved: re-resolve next time, read everything now
+        if not employee_values or sorted(employee_values[0]) != sorted(columns_from_df1):
+            get_employee_header.clear()
+            response = get_spreadsheet().values_batch_get([f"'{EMPLOYEE_SHEET_NAME}'"])
+            employee_values = response["valueRanges"][0].get("values", [])
+
+    nomination_df = values_to_dataframe(nomination_values)
+    # Decisions written after the download started are overlaid as row patches (see DecisionWriter)
+    nomination_df.attrs["loaded_at"] = started_at
+    return nomination_df, values_to_dataframe(employee_values)
+
+def invalidate_sheet_cache():
+    """
+    Drop the cached revision, sheet data and the per-revision frame and indexes
+    built from it, so the next run re-downloads.
+    Called by the Refresh button.
+    """
+    get_sheet_revision.clear()
+    get_employee_header.clear()
+    load_sheet_data.clear()
+    get_merged_frame.clear()
+    get_filter_index.clear()
+    get_search_index.clear()
+
+def normalize_nomination_id(value):
+    """Nomination IDs are matched as trimmed strings; integral floats lose their '.0'."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+def sheet_cell_value(value):
+    """Convert a frame value into a sheet cell value: NaN/None clears the cell."""
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    if isinstance(value, np.integer) or (isinstance(value, float) and value.is_integer()):
+        return int(value)
+    return value
+
+def cell_token(value):
+    """
+    Comparable form of a decision cell, equal for the loaded frame value and the raw
+    sheet string: blanks/NaN and "Pending" are "", integral floats lose their ".0".
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        value = int(value)
+    token = str(value).strip().lower()
+    return "" if token == "pending" else token
+
+def decision_version(values):
+    """Version stamp of a set of decision cells ({column: value})."""
+    joined = "\x1f".join(f"{col}={cell_token(values[col])}" for col in sorted(values))
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()[:12]
+
+def decision_versions(frame, changes):
+    """
+    Stamp each change with the version of the cells it overwrites, as this session saw
+    them. AL and BU Head decisions touch different cells, so they never conflict.
+    """
+    keys = frame["Nomination ID"].map(normalize_nomination_id)
+    versions = {}
+    for nom_id, values in changes.items():
+        row = frame[keys == normalize_nomination_id(nom_id)]
+        seen = {col: (row.iloc[0][col] if col in row.columns and not row.empty else "") for col in values}
+        versions[nom_id] = decision_version(seen)
+    return versions
+
+def sheet_values_to_frame(values):
+    """Raw sheet strings -> the values the loaded frame would hold for them."""
+    frame_values = {}
+    for col, value in values.items():
+        if col.endswith("Approval Status"):
+            value = value or "Pending"
+        elif col == "BU Head Rank":
+            value = pd.to_numeric(value, errors="coerce") if value != "" else np.nan
+        frame_values[col] = value
+    return frame_values
+
+def update_nomination_cells(changes, expected_versions=None):
+    """
+    Write decisions to Nomination Data as one batched update of just the changed cells.
+
+    changes: {nomination_id: {column_name: value}}
+    expected_versions: {nomination_id: decision_version of the cells being overwritten}
+
+    Rows are located by Nomination ID from a fresh read of the header row and the ID
+    column, so the write stays correct even if rows were appended or re-sorted since
+    the data was loaded. Columns missing from the header are appended to it.
+
+    When versions are given, only the target rows are re-read and any nomination whose
+    cells changed since the reviewer saw them is skipped, unless they already hold the
+    intended values. Returns those conflicts as {nomination_id: current cell values};
+    everything else is written.
+    """
+    sheet = get_worksheet(NOMINATION_NAME)
+    header = sheet.row_values(1)
+    ids = sheet.col_values(header.index("Nomination ID") + 1)
+    row_by_id = {normalize_nomination_id(v): i + 1 for i, v in enumerate(ids) if i > 0 and v != ""}
+
+    missing_ids = [nom_id for nom_id in changes if normalize_nomination_id(nom_id) not in row_by_id]
+    if missing_ids:
+        raise KeyError(f"Nomination ID(s) not found in sheet: {', '.join(map(str, missing_ids))}")
+
+    conflicts = {}
+    committed = set()
+    checked = [nom_id for nom_id in changes if expected_versions and nom_id in expected_versions]
+    if checked:
+        rows = [row_by_id[normalize_nomination_id(nom_id)] for nom_id in checked]
+        response = get_spreadsheet().values_batch_get([f"'{NOMINATION_NAME}'!{r}:{r}" for r in rows])
+        for nom_id, vr in zip(checked, response["valueRanges"]):
+            cells = (vr.get("values") or [[]])[0]
+            current = {
+                col: (cells[header.index(col)] if col in header and header.index(col) < len(cells) else "")
+                for col in changes[nom_id]
+            }
+            if decision_version(current) == decision_version(changes[nom_id]):
+                # Already holds these values, e.g. a retry after a write that landed
+                # but timed out: committed, nothing left to write
+                committed.add(nom_id)
+            elif decision_version(current) != expected_versions[nom_id]:
+                conflicts[nom_id] = current
+    changes = {nom_id: values for nom_id, values in changes.items()
+               if nom_id not in conflicts and nom_id not in committed}
+    if not changes:
+        return conflicts
+
+    data = []
+    for values in changes.values():
+        for col in values:
+            if col not in header:
+                header.append(col)
+                data.append({"range": gspread.utils.rowcol_to_a1(1, len(header)), "values": [[col]]})
+    if len(header) > sheet.col_count:
+        sheet.add_cols(len(header) - sheet.col_count)
+
+    for nom_id, values in changes.items():
+        row = row_by_id[normalize_nomination_id(nom_id)]
+        for col, value in values.items():
+            data.append({
+                "range": gspread.utils.rowcol_to_a1(row, header.index(col) + 1),
+                "values": [[sheet_cell_value(value)]],
+            })
+
+    sheet.batch_update(data, value_input_option="USER_ENTERED")
+    return conflicts
+
+#######################################
+# --- Background decision writer ---
+#######################################
+# Seconds the writer waits after the first queued decision so a burst is flushed as one batch
+WRITE_COALESCE_SECONDS = float(os.environ.get("RB_WRITE_COALESCE_SECONDS", "0.5"))
+WRITE_MAX_RETRIES = int(os.environ.get("RB_WRITE_MAX_RETRIES", "4"))
+# Outcomes are kept until the submitting session has seen them; this only bounds abandoned sessions
+WRITE_STATUS_TTL = int(os.environ.get("RB_WRITE_STATUS_TTL", str(24 * 3600)))
+# How often a session with submissions still saving checks for their outcome
+WRITE_STATUS_POLL_SECONDS = 2
+
+def is_transient_sheets_error(error):
+    """Quota (429) and server-side (5xx) API errors and network failures are worth retrying."""
+    if isinstance(error, gspread.exceptions.APIError):
+        return error.response.status_code in (429, 500, 502, 503, 504)
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+class DecisionWriter:
+    """
+    Process-wide write-behind queue for decision submissions.
+
+    Sessions submit {nomination_id: {column: value}} changes, stamped with the version
+    of the cells they overwrite, and get a ticket back immediately. A single worker
+    thread waits WRITE_COALESCE_SECONDS after the first queued submission and flushes
+    everything pending as few update_nomination_cells() batches as possible: tickets
+    touching different nominations share a batch, a later ticket for an already
+    batched nomination goes into the next round so its version is checked against
+    the first write. Transient Sheets errors are retried with backoff.
+
+    Written cells and the current cells of conflicting rows are kept as row patches
+    and overlaid on data loaded before they happened, so no full re-read is needed
+    to show them.
+    """
+
+    def __init__(self, write):
+        self._write = write
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = {}   # ticket -> (changes, versions), queued or in flight
+        self._patches = {}   # normalized nomination id -> (written_at, {column: value})
+        self._status = {}    # ticket -> {"state", "ids", "conflicts", "error", "updated"}
+        threading.Thread(target=self._run, name="decision-writer", daemon=True).start()
+
+    def submit(self, changes, versions):
+        ticket = uuid.uuid4().hex
+        with self._lock:
+            self._pending[ticket] = (changes, versions)
+            self._status[ticket] = {
+                "state": "pending", "ids": list(changes), "conflicts": {}, "error": None, "updated": time.time()
+            }
+        self._queue.put(ticket)
+        return ticket
+
+    def status(self, ticket):
+        with self._lock:
+            status = self._status.get(ticket)
+            return dict(status) if status else None
+
+    def acknowledge(self, ticket):
+        """Forget a finished ticket once its session has reported the outcome."""
+        with self._lock:
+            status = self._status.get(ticket)
+            if status and status["state"] != "pending":
+                del self._status[ticket]
+
+    def overlay(self, loaded_at):
+        """
+        Row patches newer than the loaded data plus all queued and in-flight changes,
+        merged per nomination in the order they happened.
+        """
+        with self._lock:
+            merged = {}
+            for nom_key, (written_at, values) in sorted(self._patches.items(), key=lambda p: p[1][0]):
+                if written_at >= loaded_at:
+                    merged.setdefault(nom_key, {}).update(values)
+            for changes, _ in self._pending.values():
+                for nom_id, values in changes.items():
+                    merged.setdefault(normalize_nomination_id(nom_id), {}).update(values)
+            return merged
+
+    def _write_with_retry(self, changes, versions):
+        for attempt in range(WRITE_MAX_RETRIES + 1):
+            try:
+                return self._write(changes, versions), None
+            except Exception as e:
+                if attempt == WRITE_MAX_RETRIES or not is_transient_sheets_error(e):
+                    return {}, e
+                time.sleep(min(2 ** attempt, 30) + random.uniform(0, 1))
+
+    def _finish(self, batch, conflicts, error):
+        with self._lock:
+            now = time.time()
+            for ticket, (changes, _) in batch:
+                self._pending.pop(ticket, None)
+                ticket_conflicts = {nom_id: conflicts[nom_id] for nom_id in changes if nom_id in conflicts}
+                if not error:
+                    for nom_id, values in changes.items():
+                        patch = sheet_values_to_frame(conflicts[nom_id]) if nom_id in conflicts else values
+                        # Merge into the row's earlier patch: an AL and a BU Head write touch different cells
+                        nom_key = normalize_nomination_id(nom_id)
+                        earlier = self._patches.get(nom_key, (now, {}))[1]
+                        self._patches[nom_key] = (now, {**earlier, **patch})
+                self._status[ticket].update(
+                    state="failed" if error else ("conflict" if ticket_conflicts else "committed"),
+                    conflicts=ticket_conflicts,
+                    error=str(error) if error else None,
+                    updated=now
+                )
+            # Forget outcomes of abandoned sessions, and patches every load has caught up with
+            for ticket in [t for t, s in self._status.items() if s["state"] != "pending" and now - s["updated"] > WRITE_STATUS_TTL]:
+                del self._status[ticket]
+            for nom_key in [k for k, (written_at, _) in self._patches.items() if now - written_at > 600]:
+                del self._patches[nom_key]
+
+    def _flush(self, batch):
+        merged, versions = {}, {}
+        for _, (changes, ticket_versions) in batch:
+            merged.update(changes)
+            versions.update(ticket_versions)
+
+        conflicts, error = self._write_with_retry(merged, versions)
+        if error is None or len(batch) == 1:
+            self._finish(batch, conflicts, error)
+        else:
+            # One bad submission must not fail everyone else's: retry them one by one
+            for ticket, (changes, ticket_versions) in batch:
+                conflicts, error = self._write_with_retry(changes, ticket_versions)
+                self._finish([(ticket, (changes, ticket_versions))], conflicts, error)
+
+    def _run(self):
+        while True:
+            tickets = [self._queue.get()]
+            time.sleep(WRITE_COALESCE_SECONDS)
+            while True:
+                try:
+                    tickets.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            with self._lock:
+                remaining = [(t, self._pending[t]) for t in tickets]
+            while remaining:
+                batch, deferred, batched_ids = [], [], set()
+                for ticket, (changes, versions) in remaining:
+                    ids = {normalize_nomination_id(nom_id) for nom_id in changes}
+                    if ids & batched_ids:
+                        deferred.append((ticket, (changes, versions)))
+                    else:
+                        batch.append((ticket, (changes, versions)))
+                        batched_ids |= ids
+                self._flush(batch)
+                remaining = deferred
+
+@st.cache_resource(show_spinner=False)
+def get_decision_writer():
+    return DecisionWriter(update_nomination_cells)
+
+def submit_decisions(frame, changes):
+    """
+    Queue decisions for the background writer, stamped with the versions of the cells
+    as shown in frame, and remember the ticket for this session.
+    """
+    ticket = get_decision_writer().submit(changes, decision_versions(frame, changes))
+    st.session_state.setdefault("write_tickets", []).append(ticket)
+
+def show_write_status():
+    """
+    Report the outcome of this session's queued decisions. While some are still saving,
+    a polling fragment reruns the page as soon as any of them finishes.
+    """
+    writer = get_decision_writer()
+    still_pending = []
+    for ticket in st.session_state.get("write_tickets", []):
+        status = writer.status(ticket)
+        if status is None:
+            continue
+        ids = ", ".join(map(str, status["ids"]))
+        if status["state"] == "pending":
+            still_pending.append(ticket)
+            continue
+        writer.acknowledge(ticket)
+        if status["state"] == "committed":
+            st.toast(f"Saved decision for Nomination ID {ids}", icon="✅")
+        elif status["state"] == "conflict":
+            for nom_id, current in status["conflicts"].items():
+                seen = ", ".join(
+                    f"{col}: {value or 'Pending' if col.endswith('Approval Status') else value or '(blank)'}"
+                    for col, value in current.items()
+                )
+                st.warning(
+                    f"Nomination ID {nom_id} was changed by another reviewer ({seen}); "
+                    "your decision for it was not saved."
+                )
+        else:
+            st.error(f"Could not save decision for Nomination ID {ids}: {status['error']}")
+    st.session_state["write_tickets"] = still_pending
+    if still_pending:
+        poll_write_status()
+
+@st.fragment(run_every=WRITE_STATUS_POLL_SECONDS)
+def poll_write_status():
+    """Shown while submissions are saving; reruns the page once any of them has an outcome."""
+    writer = get_decision_writer()
+    tickets = st.session_state.get("write_tickets", [])
+    statuses = [writer.status(ticket) for ticket in tickets]
+    if any(status is None or status["state"] != "pending" for status in statuses):
+        st.rerun()
+    st.info(f"Saving {len(tickets)} submission(s) in the background...")
+
+def apply_pending_decisions(frame, pending):
+    """
+    Overlay queued decisions and row patches written since the data was loaded,
+    so they show without re-reading the sheet.
+    """
+    if not pending:
+        return frame
+    # Shallow copy: only the columns written below are copied, the shared frame stays untouched
+    frame = frame.copy(deep=False)
+    keys = frame["Nomination ID"].map(normalize_nomination_id)
+    for nom_key, values in pending.items():
+        mask = keys == nom_key
+        for col, value in values.items():
+            if col in frame.columns and isinstance(frame[col].dtype, pd.CategoricalDtype):
+                if pd.notna(value) and value not in frame[col].cat.categories:
+                    frame[col] = frame[col].cat.add_categories([value])
+            elif isinstance(value, str) and (col not in frame.columns or frame[col].dtype != object):
+                frame[col] = frame[col].astype(object) if col in frame.columns else None
+            frame.loc[mask, col] = value
+    return frame
+
+def merge_nomination_data(df, df1):
+    """Nomination rows joined with their employee details, approval statuses defaulted to Pending."""
+    # --- Merge nomination data with employee data ---
+    merged_df = df.merge(df1[columns_from_df1], left_on="Employee ID", right_on="Employee Id", how="left")
+
+    merged_df["Employee ID"] = (
+        merged_df["Employee Id"]
+        .astype(str)
+        .str.strip()
+    )
+
+    # --- Ensure approval status columns exist ---
+    if "AL Approval Status" not in merged_df.columns:
+        merged_df["AL Approval Status"] = "Pending"
+    else:
+        merged_df["AL Approval Status"] = merged_df["AL Approval Status"].fillna("Pending")
+
+    if "BU Head Approval Status" not in merged_df.columns:
+        merged_df["BU Head Approval Status"] = "Pending"
+    else:
+        merged_df["BU Head Approval Status"] = merged_df["BU Head Approval Status"].fillna("Pending")
+
+    return merged_df
+
+# Sheet question headers -> the short names used by every page
+DISPLAY_RENAMES = {
+    "Which title would you like to nominate yourself for?": "Nominated Title",
+    "Please state your reasons for your self-nomination": "Self Nomination Reason",
+    "Have you received any Spot Awards in the last six months (H2: Jul–Dec 2025)?" : "Spot Award in last 6 months"
+}
+# Low-cardinality text columns, compared on integer category codes
+CATEGORICAL_COLUMNS = [
+    "AL Approval Status",
+    "BU Head Approval Status",
+    "Nominated Title",
+    "Spot Award in last 6 months",
+    "Account Name",
+    "Manager Name",
+    "Designation",
+]
+ID_COLUMNS = ["Nomination ID", "Employee Id"]
+
+def normalize_nomination_frame(frame):
+    """
+    Typed schema for the merged frame, applied once per revision: display column
+    names, string IDs, a nullable integer BU Head Rank and categorical text columns.
+    Prints the frame's memory before and after.
+    """
+    before = frame.memory_usage(deep=True).sum()
+    frame = frame.rename(columns=DISPLAY_RENAMES)
+
+    for col in ID_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].map(normalize_nomination_id, na_action="ignore").astype("string")
+    frame["Employee ID"] = frame["Employee Id"].fillna("")
+
+    if "BU Head Rank" in frame.columns:
+        frame["BU Head Rank"] = pd.to_numeric(frame["BU Head Rank"], errors="coerce").astype("Int64")
+    else:
+        frame["BU Head Rank"] = pd.array([pd.NA] * len(frame), dtype="Int64")
+
+    for col in CATEGORICAL_COLUMNS:
+        if col in frame.columns:
+            frame[col] = frame[col].astype("category")
+
+    after = frame.memory_usage(deep=True).sum()
+    print(f"Nomination frame memory: {before / 1024:.0f} KiB -> {after / 1024:.0f} KiB ({len(frame)} rows)")
+    return frame
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_merged_frame(revision):
+    """
+    The merged nomination frame for a sheet revision, built once and shared read-only
+    by every session. Treat it as immutable: filter it into new frames, and write only
+    through apply_pending_decisions, which copies the columns it touches.
+    """
+    df, df1 = load_sheet_data(revision)
+    merged_df = normalize_nomination_frame(merge_nomination_data(df, df1))
+    merged_df.attrs["loaded_at"] = df.attrs.get("loaded_at", 0)
+    return merged_df
+
+#######################################
+# --- Sidebar filter index ---
+#######################################
+# Sidebar filter label -> merged_df column it filters
+FILTER_COLUMNS = {
+    "Account Name": "Account Name",
+    "Manager Name": "Manager Name",
+    "Designation": "Designation",
+    "Nominated Title": "Nominated Title",
+}
+
+class FilterIndex:
+    """
+    Per-value row bitmaps (packed bits) for the sidebar filter columns of one data revision.
+
+    Selected values are OR-ed within a column and AND-ed across columns, so a filter
+    combination costs a few byte-wise operations instead of an isin scan per column.
+    Rows line up positionally with get_merged_frame for the same revision.
+    """
+
+    def __init__(self, frame, columns, options):
+        self.rows = len(frame)
+        self.options = options
+        self.bitmaps = {}
+        for label, col in columns.items():
+            values = pd.Categorical(frame[col]) if col in frame.columns else pd.Categorical([None] * self.rows)
+            self.bitmaps[label] = {
+                value: np.packbits(values.codes == code)
+                for code, value in enumerate(values.categories)
+            }
+
+    def mask(self, selections):
+        """Boolean row mask for {label: selected values}, or None when nothing is selected."""
+        mask = None
+        for label, selected in selections.items():
+            if not selected:
+                continue
+            column = self.bitmaps[label]
+            hits = np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+            for value in selected:
+                bitmap = column.get(value)
+                if bitmap is not None:
+                    hits |= bitmap
+            mask = hits if mask is None else mask & hits
+        if mask is None:
+            return None
+        return np.unpackbits(mask, count=self.rows).astype(bool)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_filter_index(revision):
+    """Filter bitmaps and option lists for a sheet revision, shared by every session."""
+    df, df1 = load_sheet_data(revision)
+    options = {
+        "Account Name": df["Account"].dropna().unique().tolist(),
+        "Manager Name": df1["Manager Name"].dropna().unique().tolist(),
+        "Designation": df1["Designation"].dropna().unique().tolist(),
+        "Nominated Title": df["Which title would you like to nominate yourself for?"].dropna().unique().tolist(),
+    }
+    return FilterIndex(get_merged_frame(revision), FILTER_COLUMNS, options)
+
+#######################################
+# --- Employee search index ---
+#######################################
+SEARCH_GRAM = 3
+SEARCH_TYPO_TOLERANCE = os.environ.get("RB_SEARCH_TYPO_TOLERANCE", "1") == "1"
+SEARCH_SUGGESTIONS = 5
+
+class SearchIndex:
+    """
+    n-gram index over employee names and IDs for one data revision.
+
+    Every 1..SEARCH_GRAM-gram of a lowercased name or ID maps to the rows containing it.
+    Short queries are a single posting lookup; longer ones intersect their n-gram
+    postings and confirm the substring on the few rows left. Rows line up
+    positionally with get_merged_frame for the same revision.
+    """
+
+    def __init__(self, names, ids):
+        self.rows = len(names)
+        self.names = ["" if pd.isna(n) else str(n) for n in names]
+        self.fields = [
+            (name.lower(), "" if pd.isna(emp_id) else str(emp_id).lower())
+            for name, emp_id in zip(self.names, ids)
+        ]
+        grams = collections.defaultdict(set)
+        words = collections.defaultdict(set)
+        for row, fields in enumerate(self.fields):
+            for text in fields:
+                for n in range(1, SEARCH_GRAM + 1):
+                    for i in range(len(text) - n + 1):
+                        grams[text[i:i + n]].add(row)
+            for word in fields[0].split():
+                words[word].add(row)
+        self.postings = {gram: np.fromiter(sorted(rows), dtype=np.int64) for gram, rows in grams.items()}
+        self.words = {word: sorted(rows) for word, rows in words.items()}
+
+    def lookup(self, query):
+        """Row positions whose name or ID contains query, ignoring case."""
+        q = query.strip().lower()
+        if len(q) <= SEARCH_GRAM:
+            return self.postings.get(q, np.empty(0, dtype=np.int64))
+        postings = sorted(
+            (self.postings.get(q[i:i + SEARCH_GRAM], np.empty(0, dtype=np.int64)) for i in range(len(q) - SEARCH_GRAM + 1)),
+            key=len
+        )
+        rows = postings[0]
+        for posting in postings[1:]:
+            if not len(rows):
+                break
+            rows = np.intersect1d(rows, posting, assume_unique=True)
+        return np.array([r for r in rows if q in self.fields[r][0] or q in self.fields[r][1]], dtype=np.int64)
+
+    def close_rows(self, query):
+        """Row positions whose name has a word within typo distance of every query word."""
+        rows = None
+        for word in query.strip().lower().split():
+            matches = difflib.get_close_matches(word, self.words.keys(), n=SEARCH_SUGGESTIONS, cutoff=0.75)
+            hits = {r for match in matches for r in self.words[match]}
+            rows = hits if rows is None else rows & hits
+        return np.array(sorted(rows or ()), dtype=np.int64)
+
+    def suggestions(self, rows, query, limit=SEARCH_SUGGESTIONS):
+        """Distinct names among rows, names starting with query first."""
+        q = query.strip().lower()
+        names = dict.fromkeys(self.names[r] for r in rows if self.names[r])
+        return sorted(names, key=lambda name: not name.lower().startswith(q))[:limit]
+
+    def mask(self, rows):
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[rows] = True
+        return mask
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_search_index(revision):
+    """Name/ID search index for a sheet revision, shared by every session."""
+    merged = get_merged_frame(revision)
+    return SearchIndex(merged["Employee Name"].tolist(), merged["Employee Id"].tolist())
+
+def search_mask(revision, query, shown=None):
+    """
+    Row mask for the sidebar search box, falling back to close matches on a typo,
+    plus the notes to show under the box (fallback notice, matching names).
+    shown: row mask of what the board displays besides the search; only those rows
+    are named in the suggestions.
+    """
+    index = get_search_index(revision)
+    notes = []
+    rows = index.lookup(query)
+    if not len(rows) and SEARCH_TYPO_TOLERANCE:
+        rows = index.close_rows(query)
+        if len(rows):
+            notes.append("No exact match, showing close matches.")
+    suggestions = index.suggestions(rows if shown is None else rows[shown[rows]], query)
+    if suggestions:
+        notes.append("Matches: " + ", ".join(suggestions))
+    return index.mask(rows), notes
+
+def load_board_frame():
+    """
+    This session's view of the board data: the sheet revision and the shared merged
+    frame with pending decisions overlaid. Stops the page if Sheets cannot be read.
+    """
+    try:
+        # --- Load data from Google Sheets (cached per sheet revision) ---
+        revision = get_sheet_revision()
+        merged_df = get_merged_frame(revision)
+
+        # --- Show decisions still waiting in, or just written by, the background writer ---
+        merged_df = apply_pending_decisions(merged_df, get_decision_writer().overlay(merged_df.attrs.get("loaded_at", 0)))
+
+    except Exception as e:
+        st.error(f"Error loading Google Sheets data: {e}")
+        st.stop()
+
+    return revision, merged_df
@@ -0,0 +1,462 @@
+"""
+Final Display Board page.
+"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import time
+import threading
+import hashlib
+import collections
+import functools
+from string import Template
+from board.data import load_board_frame
+from board.photos import (
+    default_avatar_src,
+    get_photo_fetcher,
+    get_photo_http,
+    PHOTO_MEMO_TTL,
+    PHOTO_RENDER_DEADLINE,
+    PHOTO_SIZE_CARD,
+    PHOTO_SIZE_MULTI,
+)
+
+# Paint the board at once with placeholder avatars and swap each box in as its photos arrive
+PROGRESSIVE_BOARD = os.environ.get("RB_PROGRESSIVE_BOARD", "1") == "1"
+
+#######################################
+# --- Final Display Board snapshots ---
+#######################################
+# Columns the Final Display Board is built from; any other change leaves its snapshot valid
+BOARD_COLUMNS = [
+    "Nomination ID",
+    "Employee ID",
+    "Employee Name",
+    "Account Name",
+    "Nominated Title",
+    "Spot Award in last 6 months",
+    "BU Head Approval Status",
+    "BU Head Comment",
+    "BU Head Rank"
+]
+
+def board_fingerprint(frame):
+    """
+    Hash of the rows the board shows (BU Head approved, or a Spot Award in the last six
+    months): changes when approvals, ranks or winners change, not on new nominations or
+    edits to rows that are not on the board.
+    """
+    cols = [c for c in BOARD_COLUMNS if c in frame.columns]
+    shown = frame["BU Head Approval Status"] == "Approved"
+    if "Spot Award in last 6 months" in frame.columns:
+        shown |= frame["Spot Award in last 6 months"].astype(str).str.strip().str.upper() == "YES"
+    hashed = pd.util.hash_pandas_object(frame.loc[shown, cols].astype(str), index=False)
+    return hashlib.sha1(hashed.values.tobytes()).hexdigest()
+
+def group_award_winners(frame, category_awards):
+    """
+    Build every award's winners in one vectorized pass over the nomination frame.
+
+    Returns plain records (dicts with name, id, account, comment, emp_key, is_new):
+        {"Impact Award": [...], "Spot Award": [...], "Special Mentions": [...],
+         "categories": {award: {"winner": record or None, "rising_stars": [names]}}}
+    """
+    records = pd.DataFrame({
+        "name": frame["Employee Name"],
+        "id": frame["Employee ID"],
+        "account": frame["Account Name"],
+        "comment": frame["BU Head Comment"] if "BU Head Comment" in frame.columns else np.nan,
+        "emp_key": frame["Employee ID"].where(frame["Employee ID"].notna(), "").astype(str),
+        "title": frame["Nominated Title"],
+        "rank": frame["BU Head Rank"].fillna(0),
+        "approved": frame["BU Head Approval Status"] == "Approved",
+    })
+    records["is_new"] = records["title"] == "Spot Award"
+    approved = records[records["approved"]]
+    by_title = dict(tuple(approved.groupby("title", sort=False, observed=True)))
+    columns = ["name", "id", "account", "comment", "emp_key", "is_new"]
+
+    def as_records(group):
+        return [] if group is None else group[columns].to_dict("records")
+
+    # Spot Award: approved this cycle, or already received one in the last six months
+    spot_history = frame["Spot Award in last 6 months"].astype(str).str.strip().str.upper() == "YES"
+    spot = records[(records["approved"] & records["is_new"]) | spot_history].drop_duplicates(subset=["id"])
+    spot = spot.sort_values("is_new", ascending=False, kind="stable")
+
+    category = approved[approved["title"].isin(category_awards)]
+    winners = category[category["rank"] == 1].drop_duplicates(subset=["title"]).set_index("title")
+    rising_stars = category[category["rank"] == 2].groupby("title", sort=False, observed=True)["name"].agg(list)
+
+    return {
+        "Impact Award": as_records(by_title.get("Impact Award")),
+        "Spot Award": as_records(spot),
+        "Special Mentions": as_records(by_title.get("Special Mentions")),
+        "categories": {
+            award: {
+                "winner": winners.loc[award, columns].to_dict() if award in winners.index else None,
+                "rising_stars": rising_stars.get(award, []),
+            }
+            for award in category_awards
+        },
+    }
+
+class BoardSnapshots:
+    """
+    Rendered Final Display Board boxes shared by every session, keyed by board fingerprint.
+
+    A box is stored only once all of its photos have resolved, so boxes still showing
+    placeholder avatars are rebuilt by the next viewer. Snapshots expire after ttl
+    seconds so new photos show up, and only the newest few fingerprints are kept.
+    """
+
+    def __init__(self, ttl, keep=2):
+        self.ttl = ttl
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._snapshots = collections.OrderedDict()  # fingerprint -> (created_at, {box: html})
+
+    def get(self, fingerprint):
+        with self._lock:
+            snapshot = self._snapshots.get(fingerprint)
+            if snapshot is None or time.time() - snapshot[0] > self.ttl:
+                return {}
+            return dict(snapshot[1])
+
+    def store(self, fingerprint, box, html):
+        with self._lock:
+            snapshot = self._snapshots.get(fingerprint)
+            if snapshot is None or time.time() - snapshot[0] > self.ttl:
+                snapshot = (time.time(), {})
+                self._snapshots[fingerprint] = snapshot
+            snapshot[1][box] = html
+            self._snapshots.move_to_end(fingerprint)
+            while len(self._snapshots) > self.keep:
+                self._snapshots.popitem(last=False)
+
+@st.cache_resource(show_spinner=False)
+def get_board_snapshots():
+    return BoardSnapshots(PHOTO_MEMO_TTL)
+
+#######################################
+# --- Final Display Board templates ---
+#######################################
+# Award title -> header color and, for the multi-winner boxes, the number of awards given
+AWARD_REGISTRY = {
+    "Anchor of Trust Award": {"color": "#0047FF"},
+    "Knowledge Catalyst Award": {"color": "#9C27B0"},
+    "Efficiency Architect Award": {"color": "#00BFA5"},
+    "Momentum Maker Award": {"color": "#FF6D00"},
+    "Apex Innovator Award": {"color": "#D500F9"},
+    "Ripple Effect Award": {"color": "#00C853"},
+    "Foundation Builder": {"color": "#1A237E"},
+    "Trailblazer Tactician": {"color": "#FF1744"},
+    "Impact Award": {"color": "#D4AF37"},
+    "Spot Award": {"color": "#C0C0C0", "capacity": 28},
+    "Special Mentions": {"color": "#3A3A3A", "capacity": 6},
+}
+DEFAULT_AWARD_COLOR = "#D4AF37"   # Gold
+BOX_FRAGMENT_CACHE_SIZE = 256
+
+def award_color(award_name):
+    return AWARD_REGISTRY.get(award_name, {}).get("color", DEFAULT_AWARD_COLOR)
+
+def award_title(award_name):
+    """Title shown on the box, with the award capacity when the registry has one."""
+    capacity = AWARD_REGISTRY.get(award_name, {}).get("capacity")
+    return f"{award_name} ({capacity})" if capacity else award_name
+
+CATEGORY_BOX = Template("""
+<div style="
+width: auto;
+height: ${height}px;
+background: transparent;
+border-radius: 12px;
+padding: 10px;
+color: white;
+display: flex;
+flex-direction: column;
+justify-content: flex-start;
+box-shadow: 0px 4px 10px rgba(0,0,0,0.3);
+margin: 5px 0;
+">
+<!-- Award Title -->
+<div style='font-weight:bold; font-size:18px; margin-bottom:10px; background:$color; color:#EBF4FD; padding:4px 8px; border-radius:6px; display:inline-block; text-align:left;'>
+    🏆 $title
+</div>
+
+<!-- Two columns inside card -->
+<div style="display:flex; gap:15px;">
+
+<!-- Winner Column -->
+<div style="flex:1; display:flex; flex-direction:column; align-items:flex-start; text-align:left;">
+    <br>
+    <img src='$photo' style='width:60px; height:60px; border-radius:50%; object-fit:cover; border:2px solid #fff; margin-bottom:5px;'>
+    <div style='font-size:14px; font-weight:bold; color:#888888;'>$name</div>
+    <div style='font-size:12px; font-weight:600; color:#888888;'>$account</div>
+    <div style='font-size:14px;  color:#888888;'>$id</div>
+</div>
+
+<!-- Rising Stars Column -->
+<div style="flex:1;">
+<br>
+<div style='font-weight:bold; font-size:18px; margin-bottom:5px; color:#006666;'>Rising Stars</div>
+    $rising_stars
+</div>
+
+</div>
+</div>
+""")
+RISING_STAR = Template("<div style='font-size:14px; color:#888888; text-align:left;'>$name</div>")
+RISING_STAR_LIST = Template("<div style='display:flex; flex-direction:column; gap:4px;'>$names</div>")
+NO_RISING_STARS = "<div style='font-size:14px; color:#888888;'>No Rising Stars</div>"
+
+WINNERS_BOX = Template("""
+<div style="width: $width; height: ${height}px; background: transparent;
+            border-radius: 12px; padding: 10px; color: white; display: flex; flex-direction: column;
+            box-shadow: 0px 4px 10px rgba(0,0,0,0.3); margin: 5px 0;">
+    <!-- Award Name -->
+    <div style='font-weight:bold; font-size:20px; margin-bottom:10px; background:$color; color:#EBF4FD; padding:4px 8px; border-radius:6px; display:inline-block; text-align:left;'>
+        🏆 $title
+    </div>
+    <!-- Winners section -->
+    <div style='flex:1; $layout'>
+        $cards
+    </div>
+</div>
+""")
+NO_WINNERS = "<div style='display:flex; justify-content:center; align-items:center; font-size:22px; text-align:center; width:100%;height:100%;'>No Winners</div>"
+NO_WINNERS_LAYOUT = "display:flex; gap:10px; justify-content:center; align-items:start; overflow-y:auto;"
+
+WINNER_PHOTO = Template("<img src='$photo' style='width:80px; height:80px; border-radius:50%; object-fit:cover; border:2px solid #fff; margin-bottom:5px;'>")
+NEW_BADGE = "<div style='position:absolute;top:-6px;right:-6px;z-index:10;background:#ff3b3b;color:#fff;font-size:10px;font-weight:bold;padding:2px 6px;border-radius:12px;box-shadow:0 2px 6px rgba(0,0,0,0.3);'>NEW</div>"
+
+IMPACT_CARD = Template(
+    "<div style='display:flex; flex-direction:column; align-items:center; justify-content:center; margin:5px;'>"
+    "$photo"
+    "<div style='font-size:12px; color:#888888;font-weight:bold; text-align:center;'>$name</div>"
+    "<div style='font-size:11px; color:#888888; text-align:center;'>$account</div>"
+    "<div style='font-size:11px; color:#888888; text-align:center;'>$id</div>"
+    "</div>"
+)
+SPOT_CARD = Template(
+    "<div style='display:flex; flex-direction:column; align-items:center; justify-content:center; margin:5px;'>"
+    "<div style='position:relative; display:inline-block; overflow:visible;'>$photo$badge</div>"
+    "<div style='font-size:12px; color:#888888;font-weight:bold; text-align:center;'>$name</div>"
+    "<div style='font-size:11px; color:#888888; text-align:center;'>$account</div>"
+    "<div style='font-size:11px; color:#888888; text-align:center;'>$id</div>"
+    "</div>"
+)
+MENTION_CARD = Template(
+    "<div style='flex:0 0 auto;width:320px;display:flex;flex-direction:row;align-items:center;gap:10px;margin:5px;'>"
+    "<div style='width:110px; display:flex; flex-direction:column; align-items:center; text-align:center;'>"
+    "$photo"
+    "<div style='font-size:12px;color:#888888;font-weight:bold; text-align:center;'>$name</div>"
+    "<div style='font-size:11px;  color:#888888;  text-align:center;'>$id</div>"
+    "</div>"
+    "<div style='flex:1;font-size:12px;color:#000000;font-style:italic;line-height:1.4; word-wrap:break-word; overflow-wrap:break-word; white-space:normal;'> $comment</div>"
+    "</div>"
+)
+
+# Box kind -> (card template, layout of the winners section)
+WINNER_BOX_KINDS = {
+    "impact": (IMPACT_CARD, "display:grid; grid-template-columns: 1fr; gap:10px; justify-content:center; align-items:start; overflow-y:auto;"),
+    "spot": (SPOT_CARD, "display:grid; grid-template-columns: repeat(2, 1fr); gap:10px; justify-content:center; align-items:start; overflow-y:auto;"),
+    "mentions": (MENTION_CARD, "display:flex;flex-direction:row; gap:100px; justify-content:flex-start; align-items:center; overflow-x:auto; white-space:nowrap;"),
+}
+WINNER_FIELDS = ("name", "id", "account", "photo", "comment")
+
+def freeze_winners(winners):
+    """Winner dicts as a hashable tuple, the fragment cache key for a box."""
+    return tuple(
+        tuple(str(w.get(field, "")) for field in WINNER_FIELDS) + (bool(w.get("is_new")),)
+        for w in winners
+    )
+
+@functools.lru_cache(maxsize=BOX_FRAGMENT_CACHE_SIZE)
+def render_category_box(award_name, name, emp_id, account, photo, rising_stars, height):
+    """One category award box: winner card plus its Rising Stars (a tuple of names)."""
+    if rising_stars:
+        rising_html = RISING_STAR_LIST.substitute(names="".join(RISING_STAR.substitute(name=n) for n in rising_stars))
+    else:
+        rising_html = NO_RISING_STARS
+    return CATEGORY_BOX.substitute(
+        height=height, color=award_color(award_name), title=award_title(award_name),
+        photo=photo, name=name, account=account, id=emp_id, rising_stars=rising_html
+    )
+
+@functools.lru_cache(maxsize=BOX_FRAGMENT_CACHE_SIZE)
+def render_winners_box(kind, award_name, winners, width, height):
+    """A multi-winner box (impact, spot or mentions) for winners from freeze_winners."""
+    card, layout = WINNER_BOX_KINDS[kind]
+    if winners:
+        cards = "".join(
+            card.substitute(
+                name=name, id=emp_id, account=account, comment=comment,
+                photo=WINNER_PHOTO.substitute(photo=photo) if photo else "",
+                badge=NEW_BADGE if is_new else "",
+            )
+            for name, emp_id, account, photo, comment, is_new in winners
+        )
+    else:
+        cards, layout = NO_WINNERS, NO_WINNERS_LAYOUT
+    return WINNERS_BOX.substitute(
+        width=width, height=height, color=award_color(award_name), title=award_title(award_name),
+        layout=layout, cards=cards
+    )
+
+def render():
+    _, merged_df = load_board_frame()
+
+    award_list_col1 = [
+        "Anchor of Trust Award",
+        "Knowledge Catalyst Award",
+        "Efficiency Architect Award",
+        "Momentum Maker Award",
+        "Apex Innovator Award",
+        "Ripple Effect Award",
+        "Foundation Builder",
+        "Trailblazer Tactician"]
+
+    
+    # --- Layout: one placeholder per box ---
+    placeholders = {}
+    col1, col2 = st.columns([1, 4])
+       
+    with col1:
+
+        # Second row box (smaller)
+        placeholders["Impact Award"] = st.empty()
+        st.markdown("<div style='margin:10px 0;'></div>", unsafe_allow_html=True)
+
+        placeholders["Spot Award"] = st.empty()
+        st.markdown("<div style='margin:10px 0;'></div>", unsafe_allow_html=True)
+
+    with col2:
+    
+       # First two rows with 4 boxes each
+        cols_per_row = 4
+        
+        for i,names in enumerate(award_list_col1):
+            if i % cols_per_row == 0:
+                cols = st.columns(cols_per_row)
+
+            with cols[i % cols_per_row]:
+                placeholders[names] = st.empty()
+            
+            # Spacer after each row
+            if (i + 1) % cols_per_row == 0:
+                st.markdown("<div style='margin:10px 0;'></div>", unsafe_allow_html=True)
+        
+        # Third row with a single box
+        placeholders["Special Mentions"] = st.empty()
+
+    # --- Boxes already rendered for this board data are served from the shared snapshot ---
+    snapshots = get_board_snapshots()
+    fingerprint = board_fingerprint(merged_df)
+    snapshot = snapshots.get(fingerprint)
+    for box, html in snapshot.items():
+        placeholders[box].markdown(html, unsafe_allow_html=True)
+
+    if len(snapshot) < len(placeholders):
+        # --- Winner records per box in one grouped pass; photos are filled in from photo_key at render time ---
+        awards = group_award_winners(merged_df, award_list_col1)
+        fallback_photo = default_avatar_src()
+
+        impact_winners = [{**w, "photo_key": (w["emp_key"], PHOTO_SIZE_MULTI)} for w in awards["Impact Award"]]
+        spot_winners = [{**w, "photo_key": (w["emp_key"], PHOTO_SIZE_MULTI)} for w in awards["Spot Award"]]
+        sm_winners = [{**w, "photo_key": (w["emp_key"], PHOTO_SIZE_MULTI)} for w in awards["Special Mentions"]]
+
+        category_cards = {}
+        for names, award in awards["categories"].items():
+            w = award["winner"]
+            if w is not None:
+                card = {
+                    "winner_name": w["name"],
+                    "winner_id": w["id"],
+                    "winner_account": w["account"],
+                    "photo_key": (w["id"], PHOTO_SIZE_CARD)
+                }
+            else:
+                card = {"winner_name": "No Winner", "winner_id": "00000", "winner_account": "", "photo_key": None}
+            card["rising_stars"] = award["rising_stars"]
+            category_cards[names] = card
+
+        def with_photos(winners, photos):
+            return [{**w, "photo": photos.get(w["photo_key"], fallback_photo)} for w in winners]
+
+        def category_box_html(names, photos):
+            card = category_cards[names]
+            photo_url = photos.get(card["photo_key"], fallback_photo)
+            return render_category_box(
+                names, str(card["winner_name"]), str(card["winner_id"]), str(card["winner_account"]), photo_url,
+                tuple(card["rising_stars"]), height=230
+            )
+
+        # box -> (photo keys it shows, render(photos) -> html)
+        boxes = {
+            "Impact Award": (
+                [w["photo_key"] for w in impact_winners],
+                lambda photos: render_winners_box("impact", "Impact Award", freeze_winners(with_photos(impact_winners, photos)), "290px", 230)
+            ),
+            "Spot Award": (
+                [w["photo_key"] for w in spot_winners],
+                lambda photos: render_winners_box("spot", "Spot Award", freeze_winners(with_photos(spot_winners, photos)), "290px", 475)
+            ),
+            "Special Mentions": (
+                [w["photo_key"] for w in sm_winners],
+                lambda photos: render_winners_box("mentions", "Special Mentions", freeze_winners(with_photos(sm_winners, photos)), "100%", 220)
+            ),
+        }
+        for names in award_list_col1:
+            photo_key = category_cards[names]["photo_key"]
+            boxes[names] = ([photo_key] if photo_key else [], functools.partial(category_box_html, names))
+
+        # --- Photos and rendering ---
+        photo_keys = [key for box, (keys, _) in boxes.items() if box not in snapshot for key in keys]
+
+        fetcher = get_photo_fetcher()
+        photos = {key: fetcher.cached(key) for key in dict.fromkeys(photo_keys)}
+        missing = {key for key, src in photos.items() if src is None}
+        photos = {key: src for key, src in photos.items() if src is not None}
+        outstanding = {box: missing.intersection(keys) for box, (keys, _) in boxes.items() if box not in snapshot}
+        # Keys showing the default avatar because their fetch failed; retried by the next viewer
+        failed = set()
+
+        def show_box(box):
+            html = boxes[box][1](photos)
+            placeholders[box].markdown(html, unsafe_allow_html=True)
+            # Only boxes whose photos are all real or confirmed missing are shared
+            if not outstanding[box] and not failed.intersection(boxes[box][0]):
+                snapshots.store(fingerprint, box, html)
+
+        if PROGRESSIVE_BOARD:
+            # First paint: every box with names and whatever photos are already cached
+            for box in outstanding:
+                show_box(box)
+
+            # Swap each box in as soon as all of its photos have arrived
+            for key, src, resolved in fetcher.iter_completed(missing, PHOTO_RENDER_DEADLINE):
+                photos[key] = src
+                if not resolved:
+                    failed.add(key)
+                for box, keys in outstanding.items():
+                    if key in keys:
+                        keys.discard(key)
+                        if not keys:
+                            show_box(box)
+        else:
+            # Photos not fetched by the deadline come back unresolved, keeping their boxes unshared
+            for key, (src, resolved) in fetcher.fetch_all(missing, PHOTO_RENDER_DEADLINE).items():
+                photos[key] = src
+                if not resolved:
+                    failed.add(key)
+            for keys in outstanding.values():
+                keys.clear()
+            for box in outstanding:
+                show_box(box)
+
+        if missing:
+            # Only runs that went to the photo API report its connection reuse
+            print(f"Photo API connections: {get_photo_http().stats()}")
@@ -0,0 +1,145 @@
+"""
+Nomination Form page. Static: needs no sheet data.
+"""
+import streamlit as st
+
+def render():
+    st.markdown( 
+        "<p style='margin-top:15px; color:#b0b0b0; font-size:14px; font-style:Solid;'>" 
+        'Google Form to nominate yourself for the following awards:'"</p>", 
+        unsafe_allow_html=True )
+
+    # Google Form Button
+    google_form_url = "https://docs.google.com/forms/d/e/1FAIpQLSfCvuS_dHL6cjRBwK6Qz_NsRHQXIu9jRI3SppJt3lwjhWeUCQ/viewform?usp=sharing&ouid=116479912870922545263"
+    st.markdown(
+        f"""
+        <div style='margin-bottom:20px;'>
+            <a href="{google_form_url}" target="_blank">
+                <button style="
+                    background-color:#4CAF50;  /* dark grey button */
+                    color:white;
+                    padding:12px 24px;
+                    border:none;
+                    border-radius:8px;
+                    font-size:16px;
+                    font-weight:600;
+                    cursor:pointer;">
+                    📝 Open Nomination Form
+                </button>
+            </a>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    st.markdown("---")
+
+    # Awards data
+    awards = [
+        {
+            "title": 'Reliability – "Anchor of Trust" Award',
+            "criteria": [
+                "Consistency: Delivering high-quality work on time, every time.",
+                "Dependability: Being a go-to person on the team for critical tasks.",
+                "Quality: Maintaining a high standard of accuracy and completeness in all outputs."
+            ]
+        },
+        {
+            "title": 'Learning – "Knowledge Catalyst" Award',
+            "criteria": [
+                "Initiative: Proactively seeking new skills or knowledge.",
+                "Application: Applying new learnings to a project or task.",
+                "Knowledge Sharing: Actively helping others learn and grow."
+            ]
+        },
+        {
+            "title": 'Resourcing – "Efficiency Architect" Award',
+            "criteria": [
+                "Optimization: Finding innovative ways to save time, money, or effort.",
+                "Planning: Demonstrating excellent foresight in resource allocation.",
+                "Problem-Solving: Creatively overcoming resourcing challenges."
+            ]
+        },
+        {
+            "title": 'Growth – "Momentum Maker" Award',
+            "criteria": [
+                "Contribution: Directly impacting a project or business unit's growth.",
+                "Scalability: Building solutions or processes that can grow with the company.",
+                "Proactivity: Identifying and pursuing new opportunities."
+            ]
+        },
+        {
+            "title": 'Akasa – "Apex Innovator" Award',
+            "criteria": [
+                "Vision: Introducing a completely new idea, tool, or methodology.",
+                "Impact: Leading to a significant breakthrough or change.",
+                "Excellence: Work that stands out as a top-tier example of problem-solving."
+            ]
+        },
+        {
+            "title": 'Value/Impact – "Ripple Effect" Award',
+            "criteria": [
+                "Significance: Creating substantial positive outcomes for clients, projects, or teams.",
+                "Influence: Inspiring or influencing others to improve their work.",
+                "Tangible Results: Measurable impact through data or feedback."
+            ]
+        },
+        {
+            "title": 'Institution Building – "Foundation Builder" Award',
+            "criteria": [
+                "Stewardship: Actively contributing to long-term organizational development, stability, or maturity.",
+                "Ownership: Leading processes, frameworks, or culture to strengthen the institution.",
+                "Sustainability: Building practices that deliver lasting value beyond individuals."
+            ]
+        },
+        {
+            "title": 'Above & Beyond – "Trailblazer Tactician" Award',
+            "criteria": [
+                "Resourcefulness: Using smart, creative hacks to achieve results faster and effectively.",
+                "Tenacity: Going the extra mile with relentless effort to overcome challenges and deliver outcomes.",
+                "Impact: Driving breakthrough results through innovative shortcuts or extreme positive measures."
+            ]
+        }
+    ]
+
+    # Two-column layout
+    col1, col2 = st.columns(2)
+
+    for i, award in enumerate(awards):
+
+        award_title = award['title']
+
+        if "Anchor of Trust" in award_title:
+            bg_color = "#0047FF"   # Deep Blue
+        elif "Knowledge Catalyst" in award_title:
+            bg_color = "#9C27B0"   # Purple
+        elif "Efficiency Architect" in award_title:
+            bg_color = "#00BFA5"   # Teal
+        elif "Momentum Maker" in award_title:
+            bg_color = "#FF6D00"   # Orange/Brown
+        elif "Apex Innovator" in award_title:
+            bg_color = "#D500F9"   # Magenta
+        elif "Ripple Effect" in award_title:
+            bg_color = "#00C853"   # Green
+        elif "Foundation Builder" in award_title:
+            bg_color = "#1A237E"   # Indigo
+        elif "Trailblazer Tactician" in award_title:
+            bg_color = "#FF1744"   # Crimson
+        else:
+            bg_color = "#D4AF37"   # Default dark
+            
+        html_content = f"""
+        <div style='border:1px solid #555555; border-radius:8px; padding:15px; margin-bottom:15px; background: linear-gradient(155deg, {bg_color}, #3A3A3A);
+color:white;'>
+            <p style='font-weight:bold; font-size:15px; margin-bottom:10px;'>{award['title']}</p>
+            <ul style='margin-left:15px;'>
+        """
+        for crit in award['criteria']:
+            html_content += f"<li>{crit}</li>"
+        html_content += "</ul></div>"
+
+        if i % 2 == 0:
+            col1.markdown(html_content, unsafe_allow_html=True)
+        else:
+            col2.markdown(html_content, unsafe_allow_html=True)
+    
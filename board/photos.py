@@ -0,0 +1,443 @@
+"""
+Employee photos for the Final Display Board: photo API client, disk cache,
+thumbnails, static serving and the asyncio fetcher.
+"""
+import streamlit as st
+import os
+import json
+import time
+import threading
+import uuid
+import hashlib
+import asyncio
+import collections
+import concurrent.futures
+import functools
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit
+import base64
+from PIL import Image, ImageOps, features
+from io import BytesIO
+
+#######################################
+# --- API Authentication ---
+#######################################
+API_USERNAME = "streamlit_user"
+API_PASSWORD = "streamlitadmin@mu-sigma25"
+BASE_URL = "https://muerp.mu-sigma.com/dmsRest/getEmployeeImage"
+
+headers = {
+    "userid": API_USERNAME, 
+    "password": API_PASSWORD
+}
+
+#######################################
+# --- Photo API HTTP client ---
+#######################################
+PHOTO_HTTP_POOL_SIZE = int(os.environ.get("RB_PHOTO_HTTP_POOL_SIZE", "8"))
+# Most requests in flight against one host at a time, across all sessions
+PHOTO_HTTP_MAX_PER_HOST = int(os.environ.get("RB_PHOTO_HTTP_MAX_PER_HOST", "4"))
+PHOTO_HTTP_RETRIES = int(os.environ.get("RB_PHOTO_HTTP_RETRIES", "3"))
+# (connect, read) seconds
+PHOTO_HTTP_TIMEOUT = (3.05, 10)
+
+class PhotoHttpClient:
+    """
+    Process-wide keep-alive session for the image API.
+
+    Connections are pooled per host and reused across calls and sessions. Connect
+    errors, read errors, 429 and 5xx answers are retried up to PHOTO_HTTP_RETRIES
+    times with jittered exponential backoff. Retry-After is ignored, so a throttling
+    server cannot hold a host slot past the render deadline. Every call has a
+    connect/read timeout, and at most PHOTO_HTTP_MAX_PER_HOST calls per host run at once.
+    """
+
+    def __init__(self):
+        retry = Retry(
+            total=PHOTO_HTTP_RETRIES,
+            backoff_factor=0.5,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        self._adapter = HTTPAdapter(pool_maxsize=PHOTO_HTTP_POOL_SIZE, pool_block=True, max_retries=retry)
+        self._session = requests.Session()
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+        self._lock = threading.Lock()
+        self._host_slots = {}
+
+    def _slots(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            return self._host_slots.setdefault(host, threading.BoundedSemaphore(PHOTO_HTTP_MAX_PER_HOST))
+
+    def get(self, url, **kwargs):
+        kwargs.setdefault("timeout", PHOTO_HTTP_TIMEOUT)
+        with self._slots(url):
+            return self._session.get(url, **kwargs)
+
+    def stats(self):
+        """Connections opened vs reused (requests sent over an already open connection)."""
+        opened = sent = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                opened += pool.num_connections
+                sent += pool.num_requests
+        return {"requests": sent, "connections_opened": opened, "connections_reused": max(sent - opened, 0)}
+
+@st.cache_resource(show_spinner=False)
+def get_photo_http():
+    return PhotoHttpClient()
+
+#######################################
+# --- Employee photo disk cache ---
+#######################################
+# App root (one level above this package), where static/ and .photo_cache/ live
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHOTO_CACHE_DIR = os.environ.get("RB_PHOTO_CACHE_DIR", os.path.join(APP_DIR, ".photo_cache"))
+PHOTO_CACHE_MAX_BYTES = int(os.environ.get("RB_PHOTO_CACHE_MAX_MB", "200")) * 1024 * 1024
+PHOTO_CACHE_TTL = int(os.environ.get("RB_PHOTO_CACHE_TTL", str(7 * 24 * 3600)))
+# How long an Employee ID the API had no photo for is remembered as such
+PHOTO_NEGATIVE_TTL = int(os.environ.get("RB_PHOTO_NEGATIVE_TTL", str(24 * 3600)))
+# Only the API's "no photo for this ID" answer is negatively cached
+PHOTO_MISSING_STATUSES = {404}
+
+def write_file_atomic(path, data):
+    """Write via a temp file + rename so concurrent readers never see a partial file."""
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+class PhotoDiskCache:
+    """
+    On-disk employee photo cache shared by all sessions and kept across restarts.
+
+    Image bytes are stored content-addressed under blobs/<sha256>, so employees with
+    the same picture share one file; entries/<sha1 of Employee ID>.json maps an ID to
+    its blob, fetch time and TTL. An entry without a blob is a negative entry: the ID is
+    known to have no photo. Expired entries are misses. When the blobs grow past
+    max_bytes, the least recently used entries (entry file mtime, touched on every hit)
+    are evicted along with blobs nothing references any more.
+    """
+
+    # Returned by get() for IDs known to have no photo
+    MISSING = b""
+
+    def __init__(self, root, max_bytes, ttl):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._blobs = os.path.join(root, "blobs")
+        self._entries = os.path.join(root, "entries")
+        os.makedirs(self._blobs, exist_ok=True)
+        os.makedirs(self._entries, exist_ok=True)
+        self._lock = threading.Lock()
+        self._size = sum(e.stat().st_size for e in os.scandir(self._blobs) if e.is_file())
+
+    def _entry_path(self, emp_id):
+        return os.path.join(self._entries, hashlib.sha1(str(emp_id).encode("utf-8")).hexdigest() + ".json")
+
+    def _read_entry(self, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, emp_id):
+        """Cached image bytes for emp_id, MISSING if it has no photo, None if unknown or expired."""
+        path = self._entry_path(emp_id)
+        entry = self._read_entry(path)
+        if entry is None or time.time() - entry["fetched_at"] > entry.get("ttl", self.ttl):
+            return None
+        if entry["blob"] is None:
+            return self.MISSING
+        try:
+            with open(os.path.join(self._blobs, entry["blob"]), "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            return None
+        return data
+
+    def _write_entry(self, emp_id, blob, ttl):
+        entry = {"emp_id": str(emp_id), "blob": blob, "fetched_at": time.time(), "ttl": ttl}
+        write_file_atomic(self._entry_path(emp_id), json.dumps(entry).encode("utf-8"))
+
+    def put(self, emp_id, data):
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = os.path.join(self._blobs, digest)
+        with self._lock:
+            if not os.path.exists(blob_path):
+                write_file_atomic(blob_path, data)
+                self._size += len(data)
+            self._write_entry(emp_id, digest, self.ttl)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def put_missing(self, emp_id, ttl):
+        """Remember for ttl seconds that emp_id has no photo."""
+        with self._lock:
+            self._write_entry(emp_id, None, ttl)
+
+    def _evict(self):
+        entries = []
+        for e in os.scandir(self._entries):
+            entry = self._read_entry(e.path) if e.name.endswith(".json") else None
+            # Negative entries hold no blob bytes, so evicting them frees nothing
+            if entry is not None and entry["blob"] is not None:
+                entries.append((e.stat().st_mtime, e.path, entry["blob"]))
+        entries.sort()
+        references = {}
+        for _, _, blob in entries:
+            references[blob] = references.get(blob, 0) + 1
+
+        # Drop blobs no entry points at (overwritten photos), then LRU entries until under budget
+        for e in os.scandir(self._blobs):
+            if e.is_file() and e.name not in references:
+                self._size -= e.stat().st_size
+                os.remove(e.path)
+        for _, path, blob in entries:
+            if self._size <= self.max_bytes:
+                break
+            os.remove(path)
+            references[blob] -= 1
+            if references[blob] == 0:
+                blob_path = os.path.join(self._blobs, blob)
+                self._size -= os.path.getsize(blob_path)
+                os.remove(blob_path)
+
+@st.cache_resource(show_spinner=False)
+def get_photo_cache():
+    return PhotoDiskCache(PHOTO_CACHE_DIR, PHOTO_CACHE_MAX_BYTES, PHOTO_CACHE_TTL)
+
+#######################################
+# --- Photo thumbnails ---
+#######################################
+# CSS pixel sizes the award boxes show photos at
+PHOTO_SIZE_CARD = 60     # render_category_box
+PHOTO_SIZE_MULTI = 80    # render_winners_box
+# Thumbnails are rendered at 2x the CSS size so they stay sharp on HiDPI screens
+THUMBNAIL_SCALE = 2
+THUMBNAIL_QUALITY = 80
+
+def make_thumbnail(img, size):
+    """
+    Square-crop img, downsize it to size * THUMBNAIL_SCALE pixels and encode it as
+    WebP (JPEG if this Pillow build has no WebP support). Returns (bytes, mime type).
+    """
+    img = ImageOps.exif_transpose(img)
+    if img.mode in ("RGBA", "LA", "P"):
+        # Flatten transparency onto white instead of letting convert() turn it black
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        img = background
+    else:
+        img = img.convert("RGB")
+
+    pixels = size * THUMBNAIL_SCALE
+    img = ImageOps.fit(img, (pixels, pixels), method=Image.Resampling.LANCZOS)
+
+    buffered = BytesIO()
+    if features.check("webp"):
+        img.save(buffered, format="WEBP", quality=THUMBNAIL_QUALITY, method=6)
+        return buffered.getvalue(), "image/webp"
+    img.save(buffered, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True, progressive=True)
+    return buffered.getvalue(), "image/jpeg"
+
+#######################################
+# --- Static photo store ---
+#######################################
+# Thumbnails are written to ./static/photos and served by Streamlit's static file serving
+# (server.enableStaticServing in .streamlit/config.toml). File names are content hashes,
+# so a URL never changes meaning and browsers can keep it cached across reruns and sessions.
+SERVE_PHOTOS_STATIC = os.environ.get("RB_SERVE_PHOTOS_STATIC", "1") == "1"
+PHOTO_STATIC_DIR = os.path.join(APP_DIR, "static", "photos")
+PHOTO_STATIC_URL = "app/static/photos"
+# Bundled avatar for employees without a photo, pre-sized to 2x PHOTO_SIZE_MULTI
+DEFAULT_AVATAR_PATH = os.path.join(APP_DIR, "static", "default_avatar.png")
+DEFAULT_AVATAR_URL = "app/static/default_avatar.png"
+PHOTO_STATIC_EXTENSIONS = {"image/webp": "webp", "image/jpeg": "jpg", "image/png": "png"}
+
+@st.cache_resource(show_spinner=False)
+def prepare_static_photo_store():
+    """
+    Create the store and prune files not published for two photo TTLs; any URL still
+    memoized by PhotoFetcher (for at most PHOTO_MEMO_TTL) was published within one TTL.
+    """
+    os.makedirs(PHOTO_STATIC_DIR, exist_ok=True)
+    cutoff = time.time() - 2 * PHOTO_CACHE_TTL
+    for e in os.scandir(PHOTO_STATIC_DIR):
+        if e.is_file() and not e.name.startswith(".") and e.stat().st_mtime < cutoff:
+            os.remove(e.path)
+    return PHOTO_STATIC_DIR
+
+def publish_static_photo(data, mime):
+    """Write a thumbnail to the static store once, named by its content hash, and return its URL."""
+    name = f"{hashlib.sha256(data).hexdigest()[:32]}.{PHOTO_STATIC_EXTENSIONS[mime]}"
+    path = os.path.join(prepare_static_photo_store(), name)
+    if os.path.exists(path):
+        os.utime(path)
+    else:
+        write_file_atomic(path, data)
+    return f"{PHOTO_STATIC_URL}/{name}"
+
+def photo_src(data, mime):
+    """<img src> for a thumbnail: a static store URL, or an inline data URI if static serving is off."""
+    if SERVE_PHOTOS_STATIC:
+        return publish_static_photo(data, mime)
+    img_base64 = base64.b64encode(data).decode("utf-8")
+    return f"data:{mime};base64,{img_base64}"
+
+@st.cache_resource(show_spinner=False)
+def default_avatar_src():
+    """<img src> of the bundled default avatar, resolved once per process."""
+    if SERVE_PHOTOS_STATIC:
+        return DEFAULT_AVATAR_URL
+    with open(DEFAULT_AVATAR_PATH, "rb") as f:
+        return photo_src(f.read(), "image/png")
+
+def fetch_employee_url(emp_id, size=PHOTO_SIZE_MULTI):
+    """
+    Fetch employee image (disk cache first, then the API) and return (src, resolved):
+    the <img src> of a thumbnail sized for a size x size px display, and whether that
+    answer is final. Employees without a photo get the bundled default avatar and count
+    as resolved; IDs the API has no photo for are negatively cached. A failed fetch
+    also shows the default avatar but is unresolved, so it is retried on a later run.
+    """
+    if not emp_id or emp_id == "nan":
+        return default_avatar_src(), True
+    try:
+        photo_cache = get_photo_cache()
+        content = photo_cache.get(emp_id)
+        if content is None:
+            response = get_photo_http().get(BASE_URL, headers=headers, params={"id": emp_id})
+            print(f"Response status for {emp_id}: {response.status_code}")
+            if response.status_code == 200:
+                content = response.content
+                photo_cache.put(emp_id, content)
+            elif response.status_code in PHOTO_MISSING_STATUSES:
+                photo_cache.put_missing(emp_id, PHOTO_NEGATIVE_TTL)
+            else:
+                # Auth errors, throttling and server errors are failures, not "no photo": never cached
+                return default_avatar_src(), False
+
+        if not content:
+            return default_avatar_src(), True
+
+        img = Image.open(BytesIO(content))
+        return photo_src(*make_thumbnail(img, size)), True
+    
+    except Exception as e:
+        return default_avatar_src(), False
+
+#######################################
+# --- Asyncio photo fetcher ---
+#######################################
+# Upper bound on concurrent photo resolutions while building the Final Display Board
+PHOTO_FETCH_WORKERS = int(os.environ.get("RB_PHOTO_FETCH_WORKERS", "8"))
+# Seconds the board waits for photos; late ones show the default avatar this run
+PHOTO_RENDER_DEADLINE = float(os.environ.get("RB_PHOTO_RENDER_DEADLINE", "3.0"))
+# Resolved photos are memoized no longer than a negative entry lives, so a newly uploaded photo shows up in time
+PHOTO_MEMO_TTL = min(PHOTO_CACHE_TTL, PHOTO_NEGATIVE_TTL)
+PHOTO_MEMO_MAX_ENTRIES = 2000
+
+class PhotoFetcher:
+    """
+    Process-wide asyncio engine resolving (emp_id, size) pairs to <img src> values.
+
+    A dedicated thread runs the event loop; each resolution runs fetch_employee_url in
+    a worker thread, at most PHOTO_FETCH_WORKERS at a time. A pair already in flight is
+    joined rather than fetched again, and real photos are memoized for PHOTO_MEMO_TTL.
+    Results carry fetch_employee_url's resolved flag, so callers can tell a confirmed
+    default avatar from a failed fetch.
+    fetch_all() waits for a deadline only: whatever has not arrived by then falls back
+    to the default avatar while its fetch keeps running and warms the memo and disk
+    cache for the next rerun.
+    """
+
+    def __init__(self, resolve, concurrency, fallback):
+        self._resolve = resolve
+        self._fallback = fallback
+        self._loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._lock = threading.Lock()
+        self._inflight = {}                     # key -> concurrent.futures.Future
+        self._memo = collections.OrderedDict()  # key -> (resolved_at, src)
+        threading.Thread(target=self._loop.run_forever, name="photo-fetcher", daemon=True).start()
+
+    async def _fetch(self, key):
+        async with self._semaphore:
+            return await asyncio.to_thread(self._resolve, *key)
+
+    def _done(self, key, future):
+        with self._lock:
+            self._inflight.pop(key, None)
+            if future.cancelled() or future.exception() is not None:
+                return
+            src, resolved = future.result()
+            # Fallbacks are not memoized: misses are cheap negative disk hits, failures are retried
+            if resolved and src != self._fallback:
+                self._memo[key] = (time.time(), src)
+                self._memo.move_to_end(key)
+                while len(self._memo) > PHOTO_MEMO_MAX_ENTRIES:
+                    self._memo.popitem(last=False)
+
+    def cached(self, key):
+        with self._lock:
+            hit = self._memo.get(key)
+            if hit is not None and time.time() - hit[0] <= PHOTO_MEMO_TTL:
+                return hit[1]
+            return None
+
+    def submit(self, key):
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is None:
+                future = asyncio.run_coroutine_threadsafe(self._fetch(key), self._loop)
+                self._inflight[key] = future
+                future.add_done_callback(functools.partial(self._done, key))
+            return future
+
+    def iter_completed(self, keys, deadline):
+        """
+        Fetch keys and yield (key, src, resolved) as each one completes, until all are done
+        or deadline seconds have passed; fetches still running then carry on in background.
+        """
+        futures = {self.submit(key): key for key in dict.fromkeys(keys)}
+        try:
+            for future in concurrent.futures.as_completed(futures, timeout=deadline):
+                if future.exception() is None:
+                    yield (futures[future], *future.result())
+        except concurrent.futures.TimeoutError:
+            return
+
+    def fetch_all(self, keys, deadline):
+        """
+        {key: (src, resolved)} for all keys, waiting at most deadline seconds for uncached
+        ones; keys still unfetched at the deadline are (fallback, False).
+        """
+        results = {key: self.cached(key) for key in dict.fromkeys(keys)}
+        missing = [key for key, src in results.items() if src is None]
+        results = {key: (src, True) for key, src in results.items() if src is not None}
+        results.update({key: (self._fallback, False) for key in missing})
+        results.update((key, (src, resolved)) for key, src, resolved in self.iter_completed(missing, deadline))
+        return results
+
+@st.cache_resource(show_spinner=False)
+def get_photo_fetcher():
+    # Create the shared resources fetch_employee_url uses here, on the script thread
+    get_photo_cache()
+    get_photo_http()
+    if SERVE_PHOTOS_STATIC:
+        prepare_static_photo_store()
+    return PhotoFetcher(fetch_employee_url, PHOTO_FETCH_WORKERS, default_avatar_src())
@@ -0,0 +1,291 @@
+"""
+Widgets shared by the AL and BU Head selection boards: filter sidebar,
+paginated table and decision forms.
+"""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+from board.data import FILTER_COLUMNS, get_filter_index, search_mask, submit_decisions
+
+#######################################
+# --- Review board filter sidebar ---
+#######################################
+def review_filter_mask(revision, board, listed=None):
+    """
+    Row mask (None when nothing is selected) for a review board's filters and search,
+    read from their widget state, plus the search notes. listed: row mask of what the
+    board's table lists at all, so the search only suggests names it will show.
+    """
+    filter_index = get_filter_index(revision)
+    mask = filter_index.mask({label: st.session_state.get(f"{board}_{label}") or [] for label in FILTER_COLUMNS})
+    notes = []
+    query = st.session_state.get(f"{board}_search") or ""
+    if query.strip():
+        shown = listed if mask is None else (mask if listed is None else mask & listed)
+        found, notes = search_mask(revision, query, shown)
+        mask = found if mask is None else mask & found
+    return mask, notes
+
+def same_rows(a, b):
+    if a is None or b is None:
+        return a is None and b is None
+    return np.array_equal(a, b)
+
+@st.fragment
+def review_filters(revision, board, listed=None):
+    """
+    Filter and search widgets for a review board, called inside `with st.sidebar:`.
+    Changing them reruns only this fragment; the page reruns only when the rows they
+    select actually change.
+    """
+    st.markdown("<br><br>",unsafe_allow_html = True)
+    st.markdown("<br><br>",unsafe_allow_html = True)
+    st.header("⚙️ Filters")
+    filter_index = get_filter_index(revision)
+    for label in FILTER_COLUMNS:
+        st.multiselect(label, options=filter_index.options[label], key=f"{board}_{label}")
+    st.markdown("<br><br>",unsafe_allow_html = True)
+    st.header("🔎 Search")
+    st.text_input("Search Employee Name or ID",placeholder = "Employe ID/Name", key=f"{board}_search")
+
+    rows, notes = review_filter_mask(revision, board, listed)
+    for note in notes:
+        st.caption(note)
+    if not same_rows(rows, st.session_state.get(f"{board}_rows")):
+        st.rerun()
+
+def review_board_rows(frame, revision, board, listed=None):
+    """
+    Render the board's filter sidebar and return frame narrowed to the rows it selects.
+    listed: row mask of frame for what the board's table lists (None for every row).
+    """
+    rows, _ = review_filter_mask(revision, board, listed)
+    st.session_state[f"{board}_rows"] = rows
+    with st.sidebar:
+        review_filters(revision, board, listed)
+    return frame if rows is None else frame[rows]
+
+#######################################
+# --- Decision helpers ---
+#######################################
+# BU Head rank choice -> value stored in the "BU Head Rank" column
+BU_RANK_VALUES = {"Winner": 1, "Rising Star": 2, "None": np.nan}
+
+def bulk_decision_editor(nominations, with_rank, key):
+    """
+    Editable table with one row per selected nomination: Decision, Comment and
+    (for the BU Head board) Rank. Returns the edited frame.
+    """
+    editor_df = pd.DataFrame({
+        "Nomination ID": nominations["Nomination ID"].tolist(),
+        "Employee Name": nominations["Employee Name"].tolist(),
+        "Decision": "Approve",
+        "Comment": "",
+    })
+    column_config = {
+        "Decision": st.column_config.SelectboxColumn("Decision", options=["Approve", "Reject"], required=True),
+        "Comment": st.column_config.TextColumn("Comment"),
+    }
+    if with_rank:
+        editor_df["Rank"] = "None"
+        column_config["Rank"] = st.column_config.SelectboxColumn("Rank", options=list(BU_RANK_VALUES), required=True)
+
+    return st.data_editor(
+        editor_df,
+        column_config=column_config,
+        disabled=["Nomination ID", "Employee Name"],
+        hide_index=True,
+        use_container_width=True,
+        key=key
+    )
+
+# Function to color status
+def color_status(val):
+    if val == "Approved":
+        color = 'green'
+    elif val == "Rejected":
+        color = 'red'
+    else:  # Pending
+        color = 'orange'
+    return f'color: {color}; font-weight:bold'
+
+REVIEW_PAGE_SIZE = int(os.environ.get("RB_REVIEW_PAGE_SIZE", "25"))
+# Free-text columns sent as a short preview; the full text is shown for the selected row
+REVIEW_LONG_TEXT_COLUMNS = ["Self Nomination Reason", "AL Comment", "BU Head Comment"]
+REVIEW_PREVIEW_CHARS = 80
+
+def preview_text(value, limit=REVIEW_PREVIEW_CHARS):
+    if not isinstance(value, str) or len(value) <= limit:
+        return value
+    return value[:limit].rstrip() + "…"
+
+@st.fragment
+def review_table(frame, columns, status_columns, key, height=None):
+    """
+    Paginated review table. Only the visible page is sliced, styled and sent to the
+    browser, with long free text cut to a preview; selecting a row shows its full text.
+    A fragment of its own, so paging and selecting never rerun the page or the form.
+    """
+    pages = max(1, -(-len(frame) // REVIEW_PAGE_SIZE))
+    page_key = f"{key}_page"
+    st.session_state[page_key] = min(st.session_state.get(page_key, 1), pages)
+
+    start = (st.session_state[page_key] - 1) * REVIEW_PAGE_SIZE
+    page = frame.iloc[start:start + REVIEW_PAGE_SIZE]
+    shown = page[columns].copy()
+    for col in REVIEW_LONG_TEXT_COLUMNS:
+        if col in shown.columns:
+            shown[col] = shown[col].astype(object).map(preview_text)
+
+    # Newer Streamlit rejects height=None, so only pass a height when one is given
+    sizing = {} if height is None else {"height": height}
+    event = st.dataframe(
+        shown.style.map(color_status, subset=status_columns),
+        use_container_width=True,
+        hide_index=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key=f"{key}_grid",
+        **sizing
+    )
+
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        st.caption(f"Rows {start + 1 if len(frame) else 0}–{start + len(page)} of {len(frame)}. Select a row to read its full text.")
+    with col2:
+        st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key, label_visibility="collapsed")
+
+    selected = event.selection.rows if event else []
+    if selected and selected[0] < len(page):
+        row = page.iloc[selected[0]]
+        with st.expander(f"{row['Nomination ID']} · {row['Employee Name']}", expanded=True):
+            for col in REVIEW_LONG_TEXT_COLUMNS:
+                if col in columns and isinstance(row[col], str) and row[col].strip():
+                    st.markdown(f"**{col}**")
+                    st.write(row[col])
+
+@st.fragment
+def al_decision_form(merged_df):
+    """AL decision form; choosing a nomination or typing a comment reruns only this fragment."""
+    # Dropdown to select Nomination ID
+    nomination_ids = merged_df.loc[merged_df["AL Approval Status"] == "Pending", "Nomination ID"].tolist()
+
+    bulk_mode = st.checkbox("Bulk decision mode", key="al_bulk_mode")
+
+    if bulk_mode:
+        selected_ids = st.multiselect("Select Nomination IDs to Approve/Reject:", nomination_ids)
+        if selected_ids:
+            edited = bulk_decision_editor(
+                merged_df[merged_df["Nomination ID"].isin(selected_ids)],
+                with_rank=False,
+                key=f"al_bulk_editor_{hash(tuple(selected_ids))}"
+            )
+
+            if st.button(f"Submit {len(edited)} Decisions"):
+                # All chosen decisions are queued as one submission and flushed in one batched write
+                submit_decisions(merged_df, {
+                    row["Nomination ID"]: {
+                        "AL Approval Status": "Approved" if row["Decision"] == "Approve" else "Rejected",
+                        "AL Comment": row["Comment"] or "",
+                    }
+                    for _, row in edited.iterrows()
+                })
+                st.rerun()
+    else:
+        selected_id = st.selectbox("Select Nomination ID to Approve/Reject:", nomination_ids)
+
+        # Input box for AL Comments
+        al_comment = st.text_area("AL Comment:", placeholder="Enter your comments here...")
+    
+        # Radio button for approval
+        approval_choice = st.radio("Decision:", ["Approve", "Reject"], horizontal=True)
+    
+        # Submit button
+        if st.button("Submit Decision"):
+            # Queue only the changed cells of the selected nomination
+            submit_decisions(merged_df, {
+                selected_id: {
+                    "AL Approval Status": "Approved" if approval_choice == "Approve" else "Rejected",
+                    "AL Comment": al_comment,
+                }
+            })
+
+            # Clear the text area after submission
+            st.session_state["al_comment_input"] = ""
+            st.rerun()
+
+@st.fragment
+def bu_decision_form(merged_df):
+    """BU Head decision form; choosing a nomination, rank or comment reruns only this fragment."""
+    # Dropdown: Nomination IDs where AL approved & BU Head pending
+    nomination_ids = merged_df.loc[
+        (merged_df["AL Approval Status"] == "Approved") &
+        (merged_df["BU Head Approval Status"] == "Pending"),
+        "Nomination ID"
+    ].tolist()
+
+    bulk_mode = nomination_ids and st.checkbox("Bulk decision mode", key="bu_bulk_mode")
+
+    if bulk_mode:
+        selected_ids = st.multiselect("Select Nomination IDs to Approve/Reject:", nomination_ids)
+        if selected_ids:
+            edited = bulk_decision_editor(
+                merged_df[merged_df["Nomination ID"].isin(selected_ids)],
+                with_rank=True,
+                key=f"bu_bulk_editor_{hash(tuple(selected_ids))}"
+            )
+
+            if st.button(f"Submit {len(edited)} Decisions"):
+                # All chosen decisions are queued as one submission and flushed in one batched write
+                submit_decisions(merged_df, {
+                    row["Nomination ID"]: {
+                        "BU Head Approval Status": "Approved" if row["Decision"] == "Approve" else "Rejected",
+                        "BU Head Comment": row["Comment"] or "",
+                        "BU Head Rank": BU_RANK_VALUES[row["Rank"]],
+                    }
+                    for _, row in edited.iterrows()
+                })
+                st.rerun()
+
+    elif nomination_ids:
+        # Two columns for dropdown and rank input
+        col1, col2 = st.columns([2, 1])
+    
+        with col1:
+            selected_id = st.selectbox("Select Nomination ID to Approve/Reject:", nomination_ids)
+    
+        with col2:
+            rank_choice = st.selectbox(
+                "Rank:",
+                options=["Winner", "Rising Star", "None"],
+                key="bu_rank_input"
+            )
+    
+        # Text area for BU Head comments below
+        bu_comment = st.text_area(
+            "BU Head Comments:", 
+            placeholder="Enter your comments here...", 
+            key="bu_comment_input"
+        )
+    
+        # Radio button for approval
+        approval_choice = st.radio("Decision:", ["Approve", "Reject"], horizontal=True)
+    
+        # Submit button
+        if st.button("Submit Decision"):
+            bu_rank_value = BU_RANK_VALUES[rank_choice]
+
+            # Queue only the changed cells of the selected nomination
+            submit_decisions(merged_df, {
+                selected_id: {
+                    "BU Head Approval Status": "Approved" if approval_choice == "Approve" else "Rejected",
+                    "BU Head Comment": bu_comment,
+                    "BU Head Rank": bu_rank_value,
+                }
+            })
+            st.rerun()
+
+
+    else:
+        st.info("No nominations pending for BU Head approval.")